@@ -7,12 +7,13 @@ from .conversation_store import (
 )
 from .item_store import InMemoryItemStore, ItemStore, SQLiteItemStore
 from .manager import ConversationManager
-from .models import Conversation, ConversationStatus
+from .models import Conversation, ConversationItemSpec, ConversationStatus
 
 __all__ = [
     # Models
     "Conversation",
     "ConversationStatus",
+    "ConversationItemSpec",
     # Conversation management
     "ConversationManager",
     # Conversation storage
@@ -2,12 +2,26 @@ import asyncio
 import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Final, List, Optional, Tuple
 
-import aiosqlite
+from valuecell.utils.db import SQLITE_INIT_PRAGMAS, chunked, connect_sqlite
 
 from .models import Conversation
 
+SQL_UPSERT_CONVERSATION: Final[str] = (
+    "INSERT OR REPLACE INTO conversations ("
+    "conversation_id, user_id, title, agent_name, created_at, updated_at, status"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_INSERT_CONVERSATION_IF_ABSENT: Final[str] = (
+    "INSERT INTO conversations ("
+    "conversation_id, user_id, title, agent_name, created_at, updated_at, status"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(conversation_id) DO NOTHING"
+)
+SQL_SELECT_CONVERSATION: Final[str] = (
+    "SELECT * FROM conversations WHERE conversation_id = ?"
+)
+
 
 class ConversationStore(ABC):
     """Conversation storage abstract base class - handles conversation metadata only.
@@ -39,6 +53,47 @@ class ConversationStore(ABC):
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists"""
 
+    async def load_conversations(
+        self, conversation_ids: List[str]
+    ) -> Dict[str, Conversation]:
+        """Load several conversations keyed by id; missing ids are omitted.
+
+        The default implementation loads conversations one at a time. Backends
+        able to fetch them in a single query should override it.
+        """
+        conversations: Dict[str, Conversation] = {}
+        for conversation_id in conversation_ids:
+            conversation = await self.load_conversation(conversation_id)
+            if conversation is not None:
+                conversations[conversation_id] = conversation
+        return conversations
+
+    async def save_conversations(self, conversations: List[Conversation]) -> None:
+        """Save several conversations.
+
+        The default implementation saves conversations one at a time. Backends
+        able to write them in a single statement should override it.
+        """
+        for conversation in conversations:
+            await self.save_conversation(conversation)
+
+    async def create_conversation_if_absent(
+        self, conversation: Conversation
+    ) -> Tuple[Conversation, bool]:
+        """Save `conversation` unless its id is already stored.
+
+        Returns:
+            The stored conversation and whether it was created by this call.
+
+        The default implementation loads before saving. Backends with an atomic
+        insert-if-absent should override it.
+        """
+        existing = await self.load_conversation(conversation.conversation_id)
+        if existing is not None:
+            return existing, False
+        await self.save_conversation(conversation)
+        return conversation, True
+
 
 class InMemoryConversationStore(ConversationStore):
     """In-memory ConversationStore implementation used for testing and simple scenarios.
@@ -125,7 +180,8 @@ class SQLiteConversationStore(ConversationStore):
             if self._initialized:
                 return
 
-            async with aiosqlite.connect(self.db_path) as db:
+            async with connect_sqlite(self.db_path) as db:
+                await db.executescript(SQLITE_INIT_PRAGMAS)
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversations (
@@ -156,46 +212,98 @@ class SQLiteConversationStore(ConversationStore):
             status=row["status"],
         )
 
+    @staticmethod
+    def _conversation_to_row(conversation: Conversation) -> tuple:
+        """Convert Conversation object to a parameter tuple for INSERT."""
+        return (
+            conversation.conversation_id,
+            conversation.user_id,
+            conversation.title,
+            conversation.agent_name,
+            conversation.created_at.isoformat(),
+            conversation.updated_at.isoformat(),
+            conversation.status.value
+            if hasattr(conversation.status, "value")
+            else str(conversation.status),
+        )
+
     async def save_conversation(self, conversation: Conversation) -> None:
         """Save conversation to SQLite database."""
+        await self.save_conversations([conversation])
+
+    async def save_conversations(self, conversations: List[Conversation]) -> None:
+        """Save several conversations in a single transaction."""
+        if not conversations:
+            return
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO conversations (
-                    conversation_id, user_id, title, agent_name, created_at, updated_at, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    conversation.conversation_id,
-                    conversation.user_id,
-                    conversation.title,
-                    conversation.agent_name,
-                    conversation.created_at.isoformat(),
-                    conversation.updated_at.isoformat(),
-                    conversation.status.value
-                    if hasattr(conversation.status, "value")
-                    else str(conversation.status),
-                ),
+        async with connect_sqlite(self.db_path) as db:
+            await db.executemany(
+                SQL_UPSERT_CONVERSATION,
+                [self._conversation_to_row(c) for c in conversations],
             )
             await db.commit()
 
-    async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
-        """Load conversation from SQLite database."""
+    async def create_conversation_if_absent(
+        self, conversation: Conversation
+    ) -> Tuple[Conversation, bool]:
+        """Insert with ON CONFLICT DO NOTHING; read the stored row only on conflict."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             db.row_factory = sqlite3.Row
             cur = await db.execute(
-                "SELECT * FROM conversations WHERE conversation_id = ?",
-                (conversation_id,),
+                SQL_INSERT_CONVERSATION_IF_ABSENT,
+                self._conversation_to_row(conversation),
+            )
+            if cur.rowcount == 1:
+                await db.commit()
+                return conversation, True
+
+            # The INSERT opened a write transaction even though it changed
+            # nothing, so no other connection can delete the conflicting row
+            # before this read in the same transaction; it cannot come back
+            # empty.
+            cur = await db.execute(
+                SQL_SELECT_CONVERSATION, (conversation.conversation_id,)
             )
             row = await cur.fetchone()
+            await db.commit()
+            assert row is not None
+            return self._row_to_conversation(row), False
+
+    async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
+        """Load conversation from SQLite database."""
+        await self._ensure_initialized()
+        async with connect_sqlite(self.db_path) as db:
+            db.row_factory = sqlite3.Row
+            cur = await db.execute(SQL_SELECT_CONVERSATION, (conversation_id,))
+            row = await cur.fetchone()
             return self._row_to_conversation(row) if row else None
 
+    async def load_conversations(
+        self, conversation_ids: List[str]
+    ) -> Dict[str, Conversation]:
+        """Load several conversations with one `IN (...)` query per chunk."""
+        if not conversation_ids:
+            return {}
+        await self._ensure_initialized()
+        conversations: Dict[str, Conversation] = {}
+        async with connect_sqlite(self.db_path) as db:
+            db.row_factory = sqlite3.Row
+            for chunk in chunked(list(dict.fromkeys(conversation_ids))):
+                placeholders = ", ".join("?" for _ in chunk)
+                cur = await db.execute(
+                    f"SELECT * FROM conversations WHERE conversation_id IN ({placeholders})",
+                    chunk,
+                )
+                for row in await cur.fetchall():
+                    conversation = self._row_to_conversation(row)
+                    conversations[conversation.conversation_id] = conversation
+        return conversations
+
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             cur = await db.execute(
                 "DELETE FROM conversations WHERE conversation_id = ?",
                 (conversation_id,),
@@ -208,7 +316,7 @@ class SQLiteConversationStore(ConversationStore):
     ) -> List[Conversation]:
         """List conversations from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             db.row_factory = sqlite3.Row
 
             if user_id is None:
@@ -230,7 +338,7 @@ class SQLiteConversationStore(ConversationStore):
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists in SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             cur = await db.execute(
                 "SELECT 1 FROM conversations WHERE conversation_id = ?",
                 (conversation_id,),
@@ -3,11 +3,19 @@ from __future__ import annotations
 import asyncio
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-
-import aiosqlite
+from typing import AsyncIterator, Dict, Final, List, Optional, Sequence, Tuple
 
 from valuecell.core.types import ConversationItem, ConversationItemEvent, Role
+from valuecell.utils.db import SQLITE_INIT_PRAGMAS, chunked, connect_sqlite
+
+# Rows fetched per round-trip to the aiosqlite worker thread when streaming
+ITEM_FETCH_BATCH_SIZE = 256
+
+SQL_INSERT_ITEM: Final[str] = (
+    "INSERT OR REPLACE INTO conversation_items ("
+    "item_id, role, event, conversation_id, thread_id, task_id, payload, agent_name"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
 
 
 class ItemStore(ABC):
@@ -20,6 +28,11 @@ class ItemStore(ABC):
     @abstractmethod
     async def save_item(self, item: ConversationItem) -> None: ...
 
+    async def save_items(self, items: List[ConversationItem]) -> None:
+        """Save several items; backends should override with a batched write."""
+        for item in items:
+            await self.save_item(item)
+
     @abstractmethod
     async def get_items(
         self,
@@ -30,6 +43,28 @@ class ItemStore(ABC):
         **kwargs,
     ) -> List[ConversationItem]: ...
 
+    async def iter_items(
+        self,
+        conversation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        role: Optional[Role] = None,
+        **kwargs,
+    ) -> AsyncIterator[ConversationItem]:
+        """Yield items with the same filters as `get_items`.
+
+        The default implementation materializes `get_items`; backends that
+        can read rows incrementally should override it.
+        """
+        for item in await self.get_items(
+            conversation_id=conversation_id,
+            limit=limit,
+            offset=offset,
+            role=role,
+            **kwargs,
+        ):
+            yield item
+
     @abstractmethod
     async def get_latest_item(
         self, conversation_id: str
@@ -44,6 +79,28 @@ class ItemStore(ABC):
     @abstractmethod
     async def delete_conversation_items(self, conversation_id: str) -> None: ...
 
+    async def get_items_for_conversations(
+        self,
+        conversation_ids: List[str],
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+    ) -> Dict[str, List[ConversationItem]]:
+        """Return items for several conversations keyed by conversation id.
+
+        Every requested id is present in the result, mapped to an empty list
+        when it has no items. The default implementation queries each
+        conversation separately; backends should override it with a single
+        query where possible.
+        """
+        result: Dict[str, List[ConversationItem]] = {}
+        for conversation_id in conversation_ids:
+            result[conversation_id] = await self.get_items(
+                conversation_id=conversation_id,
+                event=event,
+                component_type=component_type,
+            )
+        return result
+
 
 class InMemoryItemStore(ItemStore):
     """In-memory store for conversation items.
@@ -121,7 +178,8 @@ class SQLiteItemStore(ItemStore):
         async with self._init_lock:
             if self._initialized:
                 return
-            async with aiosqlite.connect(self.db_path) as db:
+            async with connect_sqlite(self.db_path) as db:
+                await db.executescript(SQLITE_INIT_PRAGMAS)
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversation_items (
@@ -159,46 +217,52 @@ class SQLiteItemStore(ItemStore):
             agent_name=row["agent_name"],
         )
 
+    @staticmethod
+    def _item_to_row(item: ConversationItem) -> tuple:
+        return (
+            item.item_id,
+            getattr(item.role, "value", str(item.role)),
+            getattr(item.event, "value", str(item.event)),
+            item.conversation_id,
+            item.thread_id,
+            item.task_id,
+            item.payload,
+            item.agent_name,
+        )
+
     async def save_item(self, item: ConversationItem) -> None:
+        await self.save_items([item])
+
+    async def save_items(self, items: List[ConversationItem]) -> None:
+        if not items:
+            return
         await self._ensure_initialized()
-        role_val = getattr(item.role, "value", str(item.role))
-        event_val = getattr(item.event, "value", str(item.event))
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO conversation_items (
-                    item_id, role, event, conversation_id, thread_id, task_id, payload, agent_name
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    item.item_id,
-                    role_val,
-                    event_val,
-                    item.conversation_id,
-                    item.thread_id,
-                    item.task_id,
-                    item.payload,
-                    item.agent_name,
-                ),
+        async with connect_sqlite(self.db_path) as db:
+            await db.executemany(
+                SQL_INSERT_ITEM,
+                [self._item_to_row(item) for item in items],
             )
             await db.commit()
 
-    async def get_items(
-        self,
+    @staticmethod
+    def _build_items_query(
         conversation_id: Optional[str] = None,
         limit: Optional[int] = None,
         offset: int = 0,
         role: Optional[Role] = None,
         event: Optional[ConversationItemEvent] = None,
         component_type: Optional[str] = None,
-        **kwargs,
-    ) -> List[ConversationItem]:
-        await self._ensure_initialized()
+        conversation_ids: Optional[Sequence[str]] = None,
+    ) -> Tuple[str, list]:
         params = []
         where_clauses = []
         if conversation_id is not None:
             where_clauses.append("conversation_id = ?")
             params.append(conversation_id)
+        if conversation_ids is not None:
+            placeholders = ", ".join("?" for _ in conversation_ids)
+            where_clauses.append(f"conversation_id IN ({placeholders})")
+            params.extend(conversation_ids)
         if role is not None:
             where_clauses.append("role = ?")
             params.append(getattr(role, "value", str(role)))
@@ -220,15 +284,84 @@ class SQLiteItemStore(ItemStore):
                 sql += " LIMIT -1"
             sql += " OFFSET ?"
             params.append(int(offset))
-        async with aiosqlite.connect(self.db_path) as db:
+        return sql, params
+
+    async def iter_items(
+        self,
+        conversation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        role: Optional[Role] = None,
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[ConversationItem]:
+        await self._ensure_initialized()
+        sql, params = self._build_items_query(
+            conversation_id=conversation_id,
+            limit=limit,
+            offset=offset,
+            role=role,
+            event=event,
+            component_type=component_type,
+        )
+        async with connect_sqlite(self.db_path) as db:
             db.row_factory = sqlite3.Row
-            cur = await db.execute(sql, params)
-            rows = await cur.fetchall()
-            return [self._row_to_item(r) for r in rows]
+            async with db.execute(sql, params) as cur:
+                while rows := await cur.fetchmany(ITEM_FETCH_BATCH_SIZE):
+                    for row in rows:
+                        yield self._row_to_item(row)
+
+    async def get_items(
+        self,
+        conversation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        role: Optional[Role] = None,
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+        **kwargs,
+    ) -> List[ConversationItem]:
+        return [
+            item
+            async for item in self.iter_items(
+                conversation_id=conversation_id,
+                limit=limit,
+                offset=offset,
+                role=role,
+                event=event,
+                component_type=component_type,
+            )
+        ]
+
+    async def get_items_for_conversations(
+        self,
+        conversation_ids: List[str],
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+    ) -> Dict[str, List[ConversationItem]]:
+        result: Dict[str, List[ConversationItem]] = {
+            conversation_id: [] for conversation_id in conversation_ids
+        }
+        if not result:
+            return result
+        await self._ensure_initialized()
+        async with connect_sqlite(self.db_path) as db:
+            db.row_factory = sqlite3.Row
+            for chunk in chunked(list(result)):
+                sql, params = self._build_items_query(
+                    event=event,
+                    component_type=component_type,
+                    conversation_ids=chunk,
+                )
+                cur = await db.execute(sql, params)
+                for row in await cur.fetchall():
+                    result[row["conversation_id"]].append(self._row_to_item(row))
+        return result
 
     async def get_latest_item(self, conversation_id: str) -> Optional[ConversationItem]:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             db.row_factory = sqlite3.Row
             cur = await db.execute(
                 "SELECT * FROM conversation_items WHERE conversation_id = ? ORDER BY datetime(created_at) DESC LIMIT 1",
@@ -239,7 +372,7 @@ class SQLiteItemStore(ItemStore):
 
     async def get_item(self, item_id: str) -> Optional[ConversationItem]:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             db.row_factory = sqlite3.Row
             cur = await db.execute(
                 "SELECT * FROM conversation_items WHERE item_id = ?",
@@ -250,7 +383,7 @@ class SQLiteItemStore(ItemStore):
 
     async def get_item_count(self, conversation_id: str) -> int:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             cur = await db.execute(
                 "SELECT COUNT(1) FROM conversation_items WHERE conversation_id = ?",
                 (conversation_id,),
@@ -260,7 +393,7 @@ class SQLiteItemStore(ItemStore):
 
     async def delete_conversation_items(self, conversation_id: str) -> None:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect_sqlite(self.db_path) as db:
             await db.execute(
                 "DELETE FROM conversation_items WHERE conversation_id = ?",
                 (conversation_id,),
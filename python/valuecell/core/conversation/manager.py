@@ -1,5 +1,19 @@
+import asyncio
+import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import ValidationError
 
 from valuecell.core.types import (
     ConversationItem,
@@ -11,7 +25,12 @@ from valuecell.utils.uuid import generate_conversation_id, generate_item_id
 
 from .conversation_store import ConversationStore, InMemoryConversationStore
 from .item_store import InMemoryItemStore, ItemStore
-from .models import Conversation, ConversationStatus
+from .models import Conversation, ConversationItemSpec, ConversationStatus
+
+logger = logging.getLogger(__name__)
+
+# Number of conversations kept in the in-process lookup cache
+DEFAULT_CONVERSATION_CACHE_SIZE = 512
 
 
 class ConversationManager:
@@ -20,15 +39,111 @@ class ConversationManager:
     Conversation metadata is delegated to a ConversationStore while message
     items are delegated to an ItemStore. This class exposes convenience
     methods for creating conversations, adding items, and querying state.
+
+    Conversation lookups are served from a bounded LRU cache. Every write
+    that goes through this manager refreshes the affected entries with the
+    persisted conversation, so the cache is only coherent when all writers
+    share the same manager. Cached instances stay private: lookups return
+    copies, so edits a caller never saves cannot leak into later writes.
+
+    Writes are serialized by a single asyncio.Lock: SQLite admits one writer
+    at a time, so queueing in the application avoids tasks holding
+    connections while blocked on the database lock. Reads are not locked.
     """
 
     def __init__(
         self,
         conversation_store: Optional[ConversationStore] = None,
         item_store: Optional[ItemStore] = None,
+        cache_size: int = DEFAULT_CONVERSATION_CACHE_SIZE,
     ):
         self.conversation_store = conversation_store or InMemoryConversationStore()
         self.item_store = item_store or InMemoryItemStore()
+        self._cache: OrderedDict[str, Conversation] = OrderedDict()
+        self._cache_max = cache_size
+        # Bumped on every invalidation so in-flight loads do not cache stale rows
+        self._cache_version = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._write_lock: Optional[asyncio.Lock] = None  # lazy to avoid loop-binding
+
+    def _get_write_lock(self) -> asyncio.Lock:
+        """Get or create the lock guarding every write issued through this manager."""
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        return self._write_lock
+
+    def _invalidate(self, *conversation_ids: str) -> None:
+        """Drop cached entries for the given conversations."""
+        self._cache_version += 1
+        for conversation_id in conversation_ids:
+            self._cache.pop(conversation_id, None)
+
+    def _cache_put(self, conversation: Conversation) -> None:
+        """Insert or refresh a cache entry, evicting the least recently used."""
+        self._cache[conversation.conversation_id] = conversation
+        self._cache.move_to_end(conversation.conversation_id)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    def _cache_written(self, *conversations: Conversation) -> None:
+        """Replace cached entries with copies of conversations just persisted."""
+        # Bump the version so in-flight loads of the old rows are not cached
+        self._cache_version += 1
+        for conversation in conversations:
+            self._cache_put(conversation.model_copy())
+
+    async def _save_conversations(self, conversations: List[Conversation]) -> None:
+        """Persist conversations and write them back into the cache."""
+        await self.conversation_store.save_conversations(conversations)
+        self._cache_written(*conversations)
+
+    async def _cached_conversations(
+        self, conversation_ids: List[str]
+    ) -> Dict[str, Conversation]:
+        """Return the private cached instances, bulk-loading any misses.
+
+        Missing conversations are omitted; the result keeps input order. Only
+        for in-place mutation under the write lock; never hand these out.
+        """
+        ordered = list(dict.fromkeys(conversation_ids))
+        found: Dict[str, Conversation] = {}
+        missing: List[str] = []
+        for conversation_id in ordered:
+            cached = self._cache.get(conversation_id)
+            if cached is None:
+                missing.append(conversation_id)
+                continue
+            self._cache.move_to_end(conversation_id)
+            self._cache_hits += 1
+            found[conversation_id] = cached
+
+        if missing:
+            self._cache_misses += len(missing)
+            version = self._cache_version
+            loaded = await self.conversation_store.load_conversations(missing)
+            if version == self._cache_version:
+                for conversation in loaded.values():
+                    self._cache_put(conversation)
+            found.update(loaded)
+
+        return {cid: found[cid] for cid in ordered if cid in found}
+
+    async def _get_conversations(
+        self, conversation_ids: List[str]
+    ) -> Dict[str, Conversation]:
+        """Batch form of `get_conversation`, returning copies keyed by id."""
+        cached = await self._cached_conversations(conversation_ids)
+        return {cid: conversation.model_copy() for cid, conversation in cached.items()}
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and occupancy of the conversation cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "max_size": self._cache_max,
+        }
 
     async def create_conversation(
         self,
@@ -44,25 +159,71 @@ class ConversationManager:
             title=title,
             agent_name=agent_name,
         )
-        await self.conversation_store.save_conversation(conversation)
+        async with self._get_write_lock():
+            await self.conversation_store.save_conversation(conversation)
+            self._cache_written(conversation)
         return conversation
 
+    async def get_or_create_conversation(
+        self,
+        user_id: str,
+        conversation_id: str,
+        agent_name: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> Tuple[Conversation, bool]:
+        """Return the conversation, creating it if it does not exist yet.
+
+        Returns:
+            The conversation and whether it was created by this call.
+        """
+        # Existing conversations take the lock-free read path (cache, then store)
+        conversation = await self.get_conversation(conversation_id)
+        if conversation is not None:
+            return conversation, False
+
+        candidate = Conversation(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            title=title,
+            agent_name=agent_name,
+        )
+        async with self._get_write_lock():
+            store = self.conversation_store
+            conversation, created = await store.create_conversation_if_absent(candidate)
+            self._cache_written(conversation)
+        return conversation, created
+
     async def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Get conversation metadata"""
-        return await self.conversation_store.load_conversation(conversation_id)
+        cached = self._cache.get(conversation_id)
+        if cached is not None:
+            self._cache.move_to_end(conversation_id)
+            self._cache_hits += 1
+            return cached.model_copy()
+
+        self._cache_misses += 1
+        version = self._cache_version
+        conversation = await self.conversation_store.load_conversation(conversation_id)
+        if conversation is not None and version == self._cache_version:
+            self._cache_put(conversation.model_copy())
+        return conversation
 
     async def update_conversation(self, conversation: Conversation) -> None:
         """Update conversation metadata"""
         conversation.updated_at = datetime.now()
-        await self.conversation_store.save_conversation(conversation)
+        async with self._get_write_lock():
+            await self._save_conversations([conversation])
 
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation and all its items"""
-        # First delete all items for this conversation
-        await self.item_store.delete_conversation_items(conversation_id)
+        async with self._get_write_lock():
+            # First delete all items for this conversation
+            await self.item_store.delete_conversation_items(conversation_id)
 
-        # Then delete the conversation metadata
-        return await self.conversation_store.delete_conversation(conversation_id)
+            # Then delete the conversation metadata
+            deleted = await self.conversation_store.delete_conversation(conversation_id)
+            self._invalidate(conversation_id)
+        return deleted
 
     async def list_user_conversations(
         self, user_id: Optional[str] = None, limit: int = 100, offset: int = 0
@@ -96,43 +257,114 @@ class ConversationManager:
             payload: Item payload
             item_id: Item ID (optional)
         """
-        # Verify conversation exists
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            return None
+        async with self._get_write_lock():
+            # Verify conversation exists
+            conversation = await self.get_conversation(conversation_id)
+            if not conversation:
+                return None
+
+            item = ConversationItem(
+                item_id=item_id or generate_item_id(),
+                role=role,
+                event=event,
+                conversation_id=conversation_id,
+                thread_id=thread_id,
+                task_id=task_id,
+                payload=self._serialize_payload(payload),
+                agent_name=agent_name,
+            )
+
+            # Save item directly to item store
+            await self.item_store.save_item(item)
+
+            # Update conversation timestamp
+            conversation.touch()
+            await self._save_conversations([conversation])
 
-        # Create item
-        # Serialize payload to JSON string if it's a pydantic model
-        payload_str = None
-        if payload is not None:
-            try:
-                # pydantic BaseModel supports model_dump_json
-                payload_str = payload.model_dump_json(exclude_none=True)
-            except Exception:
-                try:
-                    payload_str = str(payload)
-                except Exception:
-                    payload_str = None
-
-        item = ConversationItem(
-            item_id=item_id or generate_item_id(),
-            role=role,
-            event=event,
-            conversation_id=conversation_id,
-            thread_id=thread_id,
-            task_id=task_id,
-            payload=payload_str,
-            agent_name=agent_name,
-        )
+        return item
 
-        # Save item directly to item store
-        await self.item_store.save_item(item)
+    async def add_items(
+        self, items: Sequence[ConversationItemSpec]
+    ) -> List[ConversationItem]:
+        """Add several items with one existence check and one batched write.
 
-        # Update conversation timestamp
-        conversation.touch()
-        await self.conversation_store.save_conversation(conversation)
+        Items whose conversation does not exist are skipped.
 
-        return item
+        Returns:
+            The persisted ConversationItems, in input order.
+        """
+        if not items:
+            return []
+
+        async with self._get_write_lock():
+            conversations = await self._get_conversations(
+                [spec.conversation_id for spec in items]
+            )
+            saved: List[ConversationItem] = []
+            for spec in items:
+                if spec.conversation_id not in conversations:
+                    continue
+                # Validate each item on its own so one bad payload cannot
+                # drop the rest of the flushed batch
+                try:
+                    item = ConversationItem(
+                        item_id=spec.item_id or generate_item_id(),
+                        role=spec.role,
+                        event=spec.event,
+                        conversation_id=spec.conversation_id,
+                        thread_id=spec.thread_id,
+                        task_id=spec.task_id,
+                        payload=self._serialize_payload(spec.payload),
+                        agent_name=spec.agent_name,
+                    )
+                except ValidationError:
+                    logger.warning(
+                        "Skipping unserializable item %s in conversation %s",
+                        spec.item_id,
+                        spec.conversation_id,
+                        exc_info=True,
+                    )
+                    continue
+                saved.append(item)
+            if not saved:
+                return []
+
+            await self.item_store.save_items(saved)
+
+            # Update timestamps of the conversations that received items
+            touched = [
+                conversations[conversation_id]
+                for conversation_id in dict.fromkeys(i.conversation_id for i in saved)
+            ]
+            for conversation in touched:
+                conversation.touch()
+            await self._save_conversations(touched)
+
+        return saved
+
+    @staticmethod
+    def _serialize_payload(
+        payload: Optional[Union[ResponsePayload, str]],
+    ) -> Optional[str]:
+        """Serialize payload to the JSON string stored on ConversationItem.
+
+        Strings are treated as already serialized and stored as-is; pydantic
+        models are encoded once by pydantic-core. Never raises: a payload that
+        fails to encode falls back to `str()`, then to None, so one bad item
+        cannot fail a whole `add_items` batch.
+        """
+        if payload is None or isinstance(payload, str):
+            return payload
+        dump_json = getattr(payload, "model_dump_json", None)
+        if dump_json is not None:
+            try:
+                return dump_json(exclude_none=True)
+            except Exception:
+                pass
+        try:
+            return str(payload)
+        except Exception:
+            return None
 
     async def get_conversation_items(
         self,
@@ -152,6 +384,37 @@ class ConversationManager:
             conversation_id=conversation_id, event=event, component_type=component_type
         )
 
+    async def iter_conversation_items(
+        self,
+        conversation_id: Optional[str] = None,
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+    ) -> AsyncIterator[ConversationItem]:
+        """Stream items for a conversation as the store reads them.
+
+        Same filters as `get_conversation_items`, but memory stays bounded
+        by the store's fetch batch instead of the conversation length.
+        """
+        async for item in self.item_store.iter_items(
+            conversation_id=conversation_id, event=event, component_type=component_type
+        ):
+            yield item
+
+    async def get_items_for_conversations(
+        self,
+        conversation_ids: List[str],
+        event: Optional[ConversationItemEvent] = None,
+        component_type: Optional[str] = None,
+    ) -> Dict[str, List[ConversationItem]]:
+        """Get items for several conversations at once, keyed by conversation id.
+
+        Prefer this over calling `get_conversation_items` in a loop: SQLite
+        backends answer it with one query per 500 conversations.
+        """
+        return await self.item_store.get_items_for_conversations(
+            conversation_ids, event=event, component_type=component_type
+        )
+
     async def get_latest_item(self, conversation_id: str) -> Optional[ConversationItem]:
         """Get latest item in a conversation"""
         return await self.item_store.get_latest_item(conversation_id)
@@ -170,37 +433,60 @@ class ConversationManager:
         """Get items filtered by role"""
         return await self.item_store.get_items(conversation_id, role=role)
 
+    async def _mutate_conversations(
+        self,
+        conversation_ids: List[str],
+        mutate: Callable[[Conversation], None],
+    ) -> List[Conversation]:
+        """Apply `mutate` to each existing conversation with one load and one save.
+
+        Missing conversation ids are skipped. Returns the mutated conversations.
+        """
+        async with self._get_write_lock():
+            loaded = await self._cached_conversations(conversation_ids)
+            conversations = list(loaded.values())
+            for conversation in conversations:
+                mutate(conversation)
+            if conversations:
+                try:
+                    await self._save_conversations(conversations)
+                except BaseException:
+                    # The cached instances were mutated in place; drop them
+                    # rather than leave unsaved state in the cache
+                    self._invalidate(*loaded)
+                    raise
+        return conversations
+
     async def deactivate_conversation(self, conversation_id: str) -> bool:
         """Deactivate conversation"""
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            return False
-
-        conversation.deactivate()
-        await self.conversation_store.save_conversation(conversation)
-        return True
+        return await self.set_conversation_status(
+            conversation_id, ConversationStatus.INACTIVE
+        )
 
     async def activate_conversation(self, conversation_id: str) -> bool:
         """Activate conversation"""
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            return False
-
-        conversation.activate()
-        await self.conversation_store.save_conversation(conversation)
-        return True
+        return await self.set_conversation_status(
+            conversation_id, ConversationStatus.ACTIVE
+        )
 
     async def set_conversation_status(
         self, conversation_id: str, status: ConversationStatus
     ) -> bool:
         """Set conversation status"""
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            return False
+        return await self.set_conversations_status([conversation_id], status) == 1
+
+    async def set_conversations_status(
+        self, conversation_ids: List[str], status: ConversationStatus
+    ) -> int:
+        """Set the status of several conversations in one batch.
 
-        conversation.set_status(status)
-        await self.conversation_store.save_conversation(conversation)
-        return True
+        Returns the number of conversations updated; ids that do not exist
+        are ignored.
+        """
+        updated = await self._mutate_conversations(
+            conversation_ids, lambda conversation: conversation.set_status(status)
+        )
+        return len(updated)
 
     async def require_user_input(self, conversation_id: str) -> bool:
         """Mark conversation as requiring user input"""
@@ -1,9 +1,11 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Protocol, Union
 
 from pydantic import BaseModel, Field
 
+from valuecell.core.types import ConversationItemEvent, ResponsePayload, Role
+
 
 class ConversationStatus(str, Enum):
     """Conversation status enumeration for tracking lifecycle state."""
@@ -62,3 +64,35 @@ class Conversation(BaseModel):
     def touch(self) -> None:
         """Update the conversation's last activity timestamp"""
         self.updated_at = datetime.now()
+
+
+class ConversationItemSpec(Protocol):
+    """Item to persist via `ConversationManager.add_items`.
+
+    Mirrors the keyword arguments of `ConversationManager.add_item`; the
+    orchestrator's `SaveItem` satisfies it structurally.
+    """
+
+    @property
+    def item_id(self) -> Optional[str]: ...
+
+    @property
+    def role(self) -> Role: ...
+
+    @property
+    def event(self) -> ConversationItemEvent: ...
+
+    @property
+    def conversation_id(self) -> str: ...
+
+    @property
+    def thread_id(self) -> Optional[str]: ...
+
+    @property
+    def task_id(self) -> Optional[str]: ...
+
+    @property
+    def payload(self) -> Optional[Union[ResponsePayload, str]]: ...
+
+    @property
+    def agent_name(self) -> Optional[str]: ...
@@ -2,11 +2,15 @@
 Unit tests for valuecell.core.conversation.manager module
 """
 
+import asyncio
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from valuecell.core.conversation.conversation_store import SQLiteConversationStore
+from valuecell.core.conversation.item_store import SQLiteItemStore
 from valuecell.core.conversation.manager import ConversationManager
 from valuecell.core.conversation.models import Conversation, ConversationStatus
 from valuecell.core.types import ConversationItem, Role, NotifyResponseEvent
@@ -106,6 +110,167 @@ class TestConversationManager:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_conversation_served_from_cache(self):
+        """Test repeated lookups hit the cache instead of the store."""
+        manager = ConversationManager()
+        conversation = Conversation(conversation_id="conv-123", user_id="user-123")
+
+        # Mock the store
+        manager.conversation_store.load_conversation = AsyncMock(
+            return_value=conversation
+        )
+
+        first = await manager.get_conversation("conv-123")
+        second = await manager.get_conversation("conv-123")
+
+        assert first == second == conversation
+        # Callers get copies, never the cached instance
+        assert first is not second
+        manager.conversation_store.load_conversation.assert_called_once_with("conv-123")
+        stats = manager.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_conversation_missing_not_cached(self):
+        """Test that missing conversations are looked up again."""
+        manager = ConversationManager()
+
+        # Mock the store
+        manager.conversation_store.load_conversation = AsyncMock(return_value=None)
+
+        await manager.get_conversation("nonexistent")
+        await manager.get_conversation("nonexistent")
+
+        assert manager.conversation_store.load_conversation.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_refreshed_on_writes(self, tmp_path):
+        """Test that writes put the persisted conversation back in the cache."""
+        db_path = str(tmp_path / "conv.db")
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        store = manager.conversation_store
+        load_one = patch.object(
+            store, "load_conversation", wraps=store.load_conversation
+        )
+        load_many = patch.object(
+            store, "load_conversations", wraps=store.load_conversations
+        )
+
+        with load_one as load_conversation, load_many as load_conversations:
+            conversation = await manager.create_conversation(
+                "user-123", conversation_id="conv-123"
+            )
+            assert await manager.get_conversation("conv-123") == conversation
+
+            conversation.title = "Renamed"
+            await manager.update_conversation(conversation)
+            assert (await manager.get_conversation("conv-123")).title == "Renamed"
+
+            before = conversation.updated_at
+            await manager.add_item(
+                role=Role.USER,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id="conv-123",
+                payload='{"message": "Hello"}',
+            )
+            assert (await manager.get_conversation("conv-123")).updated_at > before
+
+            await manager.add_items(
+                [
+                    SimpleNamespace(
+                        item_id=None,
+                        role=Role.AGENT,
+                        event=NotifyResponseEvent.MESSAGE,
+                        conversation_id="conv-123",
+                        thread_id=None,
+                        task_id=None,
+                        payload="chunk",
+                        agent_name=None,
+                    )
+                ]
+            )
+            await manager.set_conversation_status(
+                "conv-123", ConversationStatus.INACTIVE
+            )
+            cached = await manager.get_conversation("conv-123")
+            assert cached.status == ConversationStatus.INACTIVE
+
+            # Every read above was served from the cache
+            load_conversation.assert_not_called()
+            load_conversations.assert_not_called()
+
+        # The cached state matches what was persisted
+        stored = await store.load_conversation("conv-123")
+        assert stored.title == "Renamed"
+        assert stored.status == ConversationStatus.INACTIVE
+        assert stored.updated_at == cached.updated_at
+
+        await manager.delete_conversation("conv-123")
+        assert manager.get_cache_stats()["size"] == 0
+        assert await manager.get_conversation("conv-123") is None
+
+    @pytest.mark.asyncio
+    async def test_unsaved_edits_are_not_persisted_by_later_writes(self, tmp_path):
+        """Test edits to a returned conversation stay local until saved."""
+        db_path = str(tmp_path / "conv.db")
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        await manager.create_conversation(
+            "user-123", title="orig", conversation_id="conv-123"
+        )
+
+        conversation = await manager.get_conversation("conv-123")
+        conversation.title = "unsaved edit"
+        await manager.add_item(
+            role=Role.USER,
+            event=NotifyResponseEvent.MESSAGE,
+            conversation_id="conv-123",
+            payload="hello",
+        )
+        await manager.set_conversation_status("conv-123", ConversationStatus.INACTIVE)
+
+        stored = await manager.conversation_store.load_conversation("conv-123")
+        assert stored.title == "orig"
+        assert (await manager.get_conversation("conv-123")).title == "orig"
+
+    @pytest.mark.asyncio
+    async def test_failed_save_evicts_mutated_entry(self):
+        """Test that a failed write does not leave unsaved state cached."""
+        manager = ConversationManager()
+        await manager.create_conversation("user-123", conversation_id="conv-123")
+        manager.conversation_store.save_conversations = AsyncMock(
+            side_effect=RuntimeError("disk full")
+        )
+
+        with pytest.raises(RuntimeError):
+            await manager.set_conversation_status(
+                "conv-123", ConversationStatus.INACTIVE
+            )
+
+        assert manager.get_cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within its configured capacity."""
+        manager = ConversationManager(cache_size=2)
+        for i in range(3):
+            await manager.create_conversation("user-123", conversation_id=f"conv-{i}")
+
+        await manager.get_conversation("conv-0")
+        await manager.get_conversation("conv-1")
+        await manager.get_conversation("conv-0")
+        await manager.get_conversation("conv-2")
+
+        assert list(manager._cache) == ["conv-0", "conv-2"]
+
     @pytest.mark.asyncio
     async def test_update_conversation(self):
         """Test updating a conversation."""
@@ -342,6 +507,28 @@ class TestConversationManager:
         assert result is not None
         assert result.payload == "string payload"
 
+    def test_serialize_payload(self):
+        """Test payload serialization fast paths."""
+        from valuecell.core.types import BaseResponseDataPayload
+
+        class Unprintable:
+            def __str__(self):
+                raise ValueError("no str")
+
+        class BrokenModel:
+            def model_dump_json(self, exclude_none=True):
+                raise ValueError("not serializable")
+
+            def __str__(self):
+                return "broken model"
+
+        serialize = ConversationManager._serialize_payload
+        assert serialize(None) is None
+        assert serialize('{"content": "raw"}') == '{"content": "raw"}'
+        assert serialize(BaseResponseDataPayload(content="hi")) == '{"content":"hi"}'
+        assert serialize(Unprintable()) is None
+        assert serialize(BrokenModel()) == "broken model"
+
     @pytest.mark.asyncio
     async def test_get_conversation_items(self):
         """Test getting conversation items."""
@@ -374,6 +561,45 @@ class TestConversationManager:
             conversation_id="conv-123", event=None, component_type=None
         )
 
+    @pytest.mark.asyncio
+    async def test_iter_conversation_items(self):
+        """Test streaming conversation items from the item store."""
+        manager = ConversationManager()
+        await manager.create_conversation("user-123", conversation_id="conv-123")
+        for text in ["Hello", "Hi there!"]:
+            await manager.add_item(
+                role=Role.USER,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id="conv-123",
+                payload=text,
+            )
+
+        result = [
+            item.payload async for item in manager.iter_conversation_items("conv-123")
+        ]
+
+        assert result == ["Hello", "Hi there!"]
+
+    @pytest.mark.asyncio
+    async def test_get_items_for_conversations(self):
+        """Test getting items for several conversations at once."""
+        manager = ConversationManager()
+        grouped = {"conv-1": [], "conv-2": []}
+
+        # Mock store
+        manager.item_store.get_items_for_conversations = AsyncMock(return_value=grouped)
+
+        result = await manager.get_items_for_conversations(
+            ["conv-1", "conv-2"], event=NotifyResponseEvent.MESSAGE
+        )
+
+        assert result == grouped
+        manager.item_store.get_items_for_conversations.assert_called_once_with(
+            ["conv-1", "conv-2"],
+            event=NotifyResponseEvent.MESSAGE,
+            component_type=None,
+        )
+
     @pytest.mark.asyncio
     async def test_get_latest_item(self):
         """Test getting latest item."""
@@ -568,6 +794,52 @@ class TestConversationManager:
         assert result is True
         assert conversation.status == ConversationStatus.REQUIRE_USER_INPUT
 
+    @pytest.mark.asyncio
+    async def test_set_conversations_status_batch(self):
+        """Test setting status on several conversations with one load/save."""
+        manager = ConversationManager()
+        conversations = {
+            "conv-1": Conversation(conversation_id="conv-1", user_id="user-123"),
+            "conv-2": Conversation(conversation_id="conv-2", user_id="user-123"),
+        }
+
+        # Mock stores
+        manager.conversation_store.load_conversations = AsyncMock(
+            return_value=conversations
+        )
+        manager.conversation_store.save_conversations = AsyncMock()
+
+        result = await manager.set_conversations_status(
+            ["conv-1", "conv-2", "missing"], ConversationStatus.INACTIVE
+        )
+
+        assert result == 2
+        assert all(
+            c.status == ConversationStatus.INACTIVE for c in conversations.values()
+        )
+        manager.conversation_store.load_conversations.assert_called_once_with(
+            ["conv-1", "conv-2", "missing"]
+        )
+        manager.conversation_store.save_conversations.assert_called_once_with(
+            list(conversations.values())
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_conversations_status_none_found(self):
+        """Test batch status update skips the save when nothing was found."""
+        manager = ConversationManager()
+
+        # Mock stores
+        manager.conversation_store.load_conversations = AsyncMock(return_value={})
+        manager.conversation_store.save_conversations = AsyncMock()
+
+        result = await manager.set_conversations_status(
+            ["missing"], ConversationStatus.ACTIVE
+        )
+
+        assert result == 0
+        manager.conversation_store.save_conversations.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_conversations_by_status(self):
         """Test getting conversations filtered by status."""
@@ -607,3 +879,228 @@ class TestConversationManager:
         manager.conversation_store.list_conversations.assert_called_once_with(
             user_id, 20, 0
         )
+
+    @pytest.mark.asyncio
+    async def test_writes_are_serialized(self):
+        """Test that concurrent writes never overlap inside the store."""
+        manager = ConversationManager()
+        active = 0
+        max_active = 0
+
+        async def slow_save(conversation):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        manager.conversation_store.save_conversation = slow_save
+
+        await asyncio.gather(
+            *(
+                manager.create_conversation("user-123", conversation_id=f"conv-{i}")
+                for i in range(5)
+            )
+        )
+
+        assert max_active == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_add_item_sqlite(self, tmp_path):
+        """Test concurrent add_item calls against SQLite all persist."""
+        db_path = str(tmp_path / "conv.db")
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        await manager.create_conversation("user-123", conversation_id="conv-123")
+
+        await asyncio.gather(
+            *(
+                manager.add_item(
+                    role=Role.AGENT,
+                    event=NotifyResponseEvent.MESSAGE,
+                    conversation_id="conv-123",
+                    payload=f"chunk {i}",
+                )
+                for i in range(20)
+            )
+        )
+
+        assert await manager.get_item_count("conv-123") == 20
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_conversation(self, tmp_path):
+        """Test get_or_create creates once, then never reaches the store."""
+        db_path = str(tmp_path / "conv.db")
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        store = manager.conversation_store
+
+        conversation, created = await manager.get_or_create_conversation(
+            "user-123", "conv-123", agent_name="agent"
+        )
+        assert created is True
+        assert conversation.agent_name == "agent"
+        assert manager.get_cache_stats()["misses"] == 1
+
+        with (
+            patch.object(
+                store, "load_conversation", wraps=store.load_conversation
+            ) as load_conversation,
+            patch.object(
+                store,
+                "create_conversation_if_absent",
+                wraps=store.create_conversation_if_absent,
+            ) as create_if_absent,
+        ):
+            again, created = await manager.get_or_create_conversation(
+                "user-456", "conv-123"
+            )
+
+        assert created is False
+        assert again == conversation
+        load_conversation.assert_not_called()
+        create_if_absent.assert_not_called()
+        assert manager.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_existing_conversation_reads_only(self, tmp_path):
+        """Test an existing, uncached conversation costs one read and no write."""
+        db_path = str(tmp_path / "conv.db")
+        first = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        await first.create_conversation("user-123", conversation_id="conv-123")
+
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        store = manager.conversation_store
+        with patch.object(
+            store,
+            "create_conversation_if_absent",
+            wraps=store.create_conversation_if_absent,
+        ) as create_if_absent:
+            conversation, created = await manager.get_or_create_conversation(
+                "user-456", "conv-123"
+            )
+
+        assert created is False
+        assert conversation.user_id == "user-123"
+        create_if_absent.assert_not_called()
+        stats = manager.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (0, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_caches_conflicting_row(self):
+        """Test a conversation created concurrently is cached from the conflict."""
+        manager = ConversationManager()
+        existing = Conversation(conversation_id="conv-123", user_id="user-123")
+        # Not visible to the first read, present by the time of the insert
+        manager.conversation_store.load_conversation = AsyncMock(return_value=None)
+        manager.conversation_store.create_conversation_if_absent = AsyncMock(
+            return_value=(existing, False)
+        )
+
+        conversation, created = await manager.get_or_create_conversation(
+            "user-456", "conv-123"
+        )
+
+        assert (conversation, created) == (existing, False)
+        assert await manager.get_conversation("conv-123") == existing
+        manager.conversation_store.load_conversation.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_add_items_keeps_batch_when_one_payload_fails(self):
+        """Test a payload that fails to serialize does not drop the batch."""
+
+        class BrokenModel:
+            def model_dump_json(self, exclude_none=True):
+                raise ValueError("not serializable")
+
+            def __str__(self):
+                raise ValueError("no str either")
+
+        manager = ConversationManager()
+        await manager.create_conversation("user-123", conversation_id="conv-1")
+        specs = [
+            SimpleNamespace(
+                item_id=f"item-{i}",
+                role=Role.AGENT,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id="conv-1",
+                thread_id=None,
+                task_id=None,
+                payload=payload,
+                agent_name=None,
+            )
+            for i, payload in enumerate(["before", BrokenModel(), "after"])
+        ]
+
+        saved = await manager.add_items(specs)
+
+        assert [item.item_id for item in saved] == ["item-0", "item-2"]
+        assert [item.payload for item in saved] == ["before", "after"]
+        assert await manager.get_item_count("conv-1") == 2
+
+    @pytest.mark.asyncio
+    async def test_add_items_batches_writes(self, tmp_path):
+        """Test add_items persists items and skips unknown conversations."""
+        db_path = str(tmp_path / "conv.db")
+        manager = ConversationManager(
+            conversation_store=SQLiteConversationStore(db_path),
+            item_store=SQLiteItemStore(db_path),
+        )
+        await manager.create_conversation("user-123", conversation_id="conv-1")
+        await manager.create_conversation("user-123", conversation_id="conv-2")
+        store = manager.conversation_store
+        before = {
+            cid: c.updated_at
+            for cid, c in (await store.load_conversations(["conv-1", "conv-2"])).items()
+        }
+
+        specs = [
+            SimpleNamespace(
+                item_id=f"item-{i}" if i % 2 else None,
+                role=Role.AGENT,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id=conversation_id,
+                thread_id=None,
+                task_id=None,
+                payload=f"chunk {i}",
+                agent_name="agent",
+            )
+            for i, conversation_id in enumerate(
+                ["conv-1", "conv-2", "missing", "conv-1"]
+            )
+        ]
+        with patch.object(
+            store, "save_conversations", wraps=store.save_conversations
+        ) as save_conversations:
+            saved = await manager.add_items(specs)
+
+        # Each touched conversation is saved once, in one batch
+        save_conversations.assert_awaited_once()
+        (touched,) = save_conversations.await_args.args
+        assert [c.conversation_id for c in touched] == ["conv-1", "conv-2"]
+        persisted = await store.load_conversations(["conv-1", "conv-2"])
+        for cid, conversation in persisted.items():
+            assert conversation.updated_at > before[cid]
+
+        assert [item.conversation_id for item in saved] == [
+            "conv-1",
+            "conv-2",
+            "conv-1",
+        ]
+        assert all(item.item_id for item in saved)
+        assert await manager.get_item_count("conv-1") == 2
+        assert await manager.get_item_count("conv-2") == 1
+        assert await manager.get_item_count("missing") == 0
+
+        assert await manager.add_items([]) == []
+        assert await manager.add_items(specs[2:3]) == []
@@ -257,6 +257,34 @@ class TestInMemoryConversationStore:
         assert result[0].conversation_id == "conv-3"
         assert result[1].conversation_id == "conv-2"
 
+    @pytest.mark.asyncio
+    async def test_load_conversations_skips_missing(self):
+        """Test batch loading returns only existing conversations."""
+        store = InMemoryConversationStore()
+        await store.save_conversation(
+            Conversation(conversation_id="conv-1", user_id="user-123")
+        )
+        await store.save_conversation(
+            Conversation(conversation_id="conv-2", user_id="user-123")
+        )
+
+        result = await store.load_conversations(["conv-1", "missing", "conv-2"])
+
+        assert set(result) == {"conv-1", "conv-2"}
+
+    @pytest.mark.asyncio
+    async def test_save_conversations(self):
+        """Test saving several conversations at once."""
+        store = InMemoryConversationStore()
+        conversations = [
+            Conversation(conversation_id=f"conv-{i}", user_id="user-123")
+            for i in range(3)
+        ]
+
+        await store.save_conversations(conversations)
+
+        assert store.get_conversation_count() == 3
+
     def test_clear_all(self):
         """Test clear_all method."""
         store = InMemoryConversationStore()
@@ -282,6 +310,19 @@ class TestInMemoryConversationStore:
 
         assert count == 3
 
+    @pytest.mark.asyncio
+    async def test_create_conversation_if_absent(self):
+        """Test default create-if-absent keeps the stored conversation."""
+        store = InMemoryConversationStore()
+        first = Conversation(conversation_id="conv-1", user_id="user-1", title="A")
+
+        assert await store.create_conversation_if_absent(first) == (first, True)
+
+        second = Conversation(conversation_id="conv-1", user_id="user-2", title="B")
+        stored, created = await store.create_conversation_if_absent(second)
+        assert created is False
+        assert stored.title == "A"
+
 
 class TestSQLiteConversationStore:
     """Test SQLiteConversationStore implementation."""
@@ -597,3 +638,75 @@ class TestSQLiteConversationStore:
         # All should succeed and return True
         assert all(results)
         assert temp_db_store._initialized is True
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_conversations_batch(self, temp_db_store):
+        """Test batch save and load round-trip, including missing ids."""
+        store = temp_db_store
+        conversations = [
+            Conversation(conversation_id=f"conv-{i}", user_id="user-123", title=f"T{i}")
+            for i in range(3)
+        ]
+
+        await store.save_conversations(conversations)
+        result = await store.load_conversations(
+            ["conv-0", "conv-2", "missing", "conv-0"]
+        )
+
+        assert set(result) == {"conv-0", "conv-2"}
+        assert result["conv-2"].title == "T2"
+
+    @pytest.mark.asyncio
+    async def test_load_conversations_chunks_large_id_lists(self, temp_db_store):
+        """Test batch loading more ids than fit in a single statement."""
+        store = temp_db_store
+        conversations = [
+            Conversation(conversation_id=f"conv-{i}", user_id="user-123")
+            for i in range(1200)
+        ]
+        await store.save_conversations(conversations)
+
+        result = await store.load_conversations(
+            [c.conversation_id for c in conversations]
+        )
+
+        assert len(result) == 1200
+
+    @pytest.mark.asyncio
+    async def test_batch_methods_with_empty_input(self, temp_db_store):
+        """Test batch methods are no-ops for empty input."""
+        store = temp_db_store
+
+        await store.save_conversations([])
+
+        assert await store.load_conversations([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_connection_pragmas(self, temp_db_store):
+        """Test schema init enables WAL and connections use synchronous=NORMAL."""
+        from valuecell.utils.db import connect_sqlite
+
+        await temp_db_store._ensure_initialized()
+
+        async with connect_sqlite(temp_db_store.db_path) as db:
+            journal_mode = await (await db.execute("PRAGMA journal_mode")).fetchone()
+            synchronous = await (await db.execute("PRAGMA synchronous")).fetchone()
+
+        assert journal_mode[0] == "wal"
+        assert synchronous[0] == 1  # NORMAL
+
+    @pytest.mark.asyncio
+    async def test_create_conversation_if_absent(self, temp_db_store):
+        """Test insert-if-absent creates once and returns the stored row after."""
+        store = temp_db_store
+        first = Conversation(conversation_id="conv-1", user_id="user-1", title="A")
+
+        stored, created = await store.create_conversation_if_absent(first)
+        assert created is True
+        assert stored is first
+
+        second = Conversation(conversation_id="conv-1", user_id="user-2", title="B")
+        stored, created = await store.create_conversation_if_absent(second)
+        assert created is False
+        assert stored.user_id == "user-1"
+        assert stored.title == "A"
@@ -432,3 +432,45 @@ class TestInMemoryItemStore:
         assert len(result) == 2
         result_ids = {item.item_id for item in result}
         assert result_ids == {"agent-conv1", "agent-conv2"}
+
+    @pytest.mark.asyncio
+    async def test_get_items_for_conversations(self):
+        """Test grouping items for several conversations."""
+        store = InMemoryItemStore()
+        for conv_id, item_id in [("conv-1", "a"), ("conv-1", "b"), ("conv-2", "c")]:
+            await store.save_item(
+                ConversationItem(
+                    item_id=item_id,
+                    role=Role.USER,
+                    event=NotifyResponseEvent.MESSAGE,
+                    conversation_id=conv_id,
+                    payload="hi",
+                )
+            )
+
+        result = await store.get_items_for_conversations(
+            ["conv-1", "conv-2", "missing"]
+        )
+
+        assert [i.item_id for i in result["conv-1"]] == ["a", "b"]
+        assert [i.item_id for i in result["conv-2"]] == ["c"]
+        assert result["missing"] == []
+
+    @pytest.mark.asyncio
+    async def test_iter_items(self):
+        """Test streaming items through the default iter_items."""
+        store = InMemoryItemStore()
+        for item_id in ["a", "b", "c"]:
+            await store.save_item(
+                ConversationItem(
+                    item_id=item_id,
+                    role=Role.USER,
+                    event=NotifyResponseEvent.MESSAGE,
+                    conversation_id="conv-1",
+                    payload="hi",
+                )
+            )
+
+        result = [item.item_id async for item in store.iter_items("conv-1", offset=1)]
+
+        assert result == ["b", "c"]
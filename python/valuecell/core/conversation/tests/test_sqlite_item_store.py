@@ -2,7 +2,10 @@ import os
 import tempfile
 
 import pytest
-from valuecell.core.conversation.item_store import SQLiteItemStore
+from valuecell.core.conversation.item_store import (
+    ITEM_FETCH_BATCH_SIZE,
+    SQLiteItemStore,
+)
 from valuecell.core.types import ConversationItem, Role, SystemResponseEvent
 
 
@@ -190,3 +193,121 @@ async def test_sqlite_item_store_filters_and_pagination():
     finally:
         if os.path.exists(path):
             os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_get_items_for_conversations():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+
+        for conv_id, item_id, event, payload in [
+            ("c1", "c1-a", SystemResponseEvent.THREAD_STARTED, '{"a":1}'),
+            ("c1", "c1-b", SystemResponseEvent.DONE, '{"component_type":"card"}'),
+            ("c2", "c2-a", SystemResponseEvent.THREAD_STARTED, '{"a":2}'),
+            ("c3", "c3-a", SystemResponseEvent.THREAD_STARTED, '{"a":3}'),
+        ]:
+            await store.save_item(
+                ConversationItem(
+                    item_id=item_id,
+                    role=Role.SYSTEM,
+                    event=event,
+                    conversation_id=conv_id,
+                    payload=payload,
+                )
+            )
+
+        grouped = await store.get_items_for_conversations(["c1", "c2", "empty"])
+        assert set(grouped) == {"c1", "c2", "empty"}
+        assert {i.item_id for i in grouped["c1"]} == {"c1-a", "c1-b"}
+        assert [i.item_id for i in grouped["c2"]] == ["c2-a"]
+        assert grouped["empty"] == []
+
+        # filters apply across every requested conversation
+        started = await store.get_items_for_conversations(
+            ["c1", "c2"], event=SystemResponseEvent.THREAD_STARTED
+        )
+        assert [i.item_id for i in started["c1"]] == ["c1-a"]
+        assert [i.item_id for i in started["c2"]] == ["c2-a"]
+
+        cards = await store.get_items_for_conversations(
+            ["c1", "c2"], component_type="card"
+        )
+        assert [i.item_id for i in cards["c1"]] == ["c1-b"]
+        assert cards["c2"] == []
+
+        # bulk and per-conversation reads build their filters the same way
+        for conv_id in ("c1", "c2"):
+            single = await store.get_items(conv_id, component_type="card")
+            assert [i.item_id for i in single] == [i.item_id for i in cards[conv_id]]
+
+        assert await store.get_items_for_conversations([]) == {}
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_iter_items_streams_in_batches():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+        total = ITEM_FETCH_BATCH_SIZE * 2 + 10
+        for i in range(total):
+            await store.save_item(
+                ConversationItem(
+                    item_id=f"i{i}",
+                    role=Role.AGENT if i % 2 else Role.USER,
+                    event=SystemResponseEvent.THREAD_STARTED,
+                    conversation_id="s1",
+                    payload='{"a":1}',
+                )
+            )
+
+        streamed = [item.item_id async for item in store.iter_items("s1")]
+        assert len(streamed) == total
+        assert set(streamed) == {f"i{i}" for i in range(total)}
+
+        # filters and pagination are shared with get_items
+        agents = [i async for i in store.iter_items("s1", role=Role.AGENT, limit=5)]
+        assert len(agents) == 5
+        assert all(i.role == Role.AGENT for i in agents)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_save_items_bulk():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+        items = [
+            ConversationItem(
+                item_id=f"i{i}",
+                role=Role.AGENT,
+                event=SystemResponseEvent.THREAD_STARTED,
+                conversation_id="s1" if i % 2 else "s2",
+                payload=f'{{"n":{i}}}',
+            )
+            for i in range(10)
+        ]
+        await store.save_items(items)
+        assert await store.get_item_count("s1") == 5
+        assert await store.get_item_count("s2") == 5
+
+        # replacing an existing item keeps a single row
+        items[0].payload = '{"n":"updated"}'
+        await store.save_items([items[0]])
+        assert await store.get_item_count("s2") == 5
+        got = await store.get_item("i0")
+        assert got is not None and got.payload == '{"n":"updated"}'
+
+        await store.save_items([])
+        assert await store.get_item_count("s1") == 5
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+from functools import cached_property, lru_cache
 from typing import AsyncGenerator, Dict, Optional
 
 from a2a.types import TaskArtifactUpdateEvent, TaskState, TaskStatusUpdateEvent
@@ -58,6 +59,19 @@ DEFAULT_CONTEXT_TIMEOUT_SECONDS = 3600  # 1 hour
 ASYNC_SLEEP_INTERVAL = 0.1  # 100ms
 
 
+@lru_cache(maxsize=1)
+def _default_conversation_manager(db_path: str) -> ConversationManager:
+    """Return the process-wide SQLite-backed ConversationManager for `db_path`.
+
+    Sharing one manager keeps its lookup cache and write lock coherent across
+    every orchestrator in the process and avoids rebuilding stores per call.
+    """
+    return ConversationManager(
+        conversation_store=SQLiteConversationStore(db_path=db_path),
+        item_store=SQLiteItemStore(db_path=db_path),
+    )
+
+
 class ExecutionContext:
     """Manage the state of an interrupted execution for later resumption.
 
@@ -149,11 +163,10 @@ class AgentOrchestrator:
     - Error handling and recovery
     """
 
-    def __init__(self):
-        db_path = resolve_db_path()
-        self.conversation_manager = ConversationManager(
-            conversation_store=SQLiteConversationStore(db_path=db_path),
-            item_store=SQLiteItemStore(db_path=db_path),
+    def __init__(self, conversation_manager: Optional[ConversationManager] = None):
+        # Reuse the shared manager unless the caller wants an isolated one
+        self.conversation_manager = (
+            conversation_manager or _default_conversation_manager(resolve_db_path())
         )
         self.task_manager = TaskManager()
         self.agent_connections = RemoteConnections()
@@ -164,16 +177,24 @@ class AgentOrchestrator:
         # Initialize execution context management
         self._execution_contexts: Dict[str, ExecutionContext] = {}
 
-        # Initialize planner
-        self.planner = ExecutionPlanner(self.agent_connections)
-
-        # Initialize Super Agent (triage/frontline agent)
-        self.super_agent = SuperAgent()
-
         self._response_factory = ResponseFactory()
         # Buffer for streaming responses -> persisted ConversationItems
         self._response_buffer = ResponseBuffer()
 
+    @cached_property
+    def planner(self) -> ExecutionPlanner:
+        """Execution planner, built on first use."""
+        return ExecutionPlanner(self.agent_connections)
+
+    @cached_property
+    def super_agent(self) -> SuperAgent:
+        """Super Agent (triage/frontline agent), built on first use.
+
+        Constructing it resolves the model and tools, so orchestrators that
+        only serve conversation queries never pay for it.
+        """
+        return SuperAgent()
+
     # ==================== Public API Methods ====================
 
     async def process_user_input(
@@ -203,16 +224,13 @@ class AgentOrchestrator:
 
         try:
             # Ensure conversation exists
-            conversation = await self.conversation_manager.get_conversation(
-                conversation_id
+            (
+                conversation,
+                created,
+            ) = await self.conversation_manager.get_or_create_conversation(
+                user_id, conversation_id, agent_name=agent_name
             )
-            if not conversation:
-                await self.conversation_manager.create_conversation(
-                    user_id, conversation_id=conversation_id, agent_name=agent_name
-                )
-                conversation = await self.conversation_manager.get_conversation(
-                    conversation_id
-                )
+            if created:
                 yield self._response_factory.conversation_started(
                     conversation_id=conversation_id
                 )
@@ -252,12 +270,9 @@ class AgentOrchestrator:
         """
         if self.user_input_manager.provide_response(conversation_id, response):
             # Update conversation status to active
-            conversation = await self.conversation_manager.get_conversation(
-                conversation_id
+            await self.conversation_manager.set_conversation_status(
+                conversation_id, ConversationStatus.ACTIVE
             )
-            if conversation:
-                conversation.activate()
-                await self.conversation_manager.update_conversation(conversation)
 
     def has_pending_user_input(self, conversation_id: str) -> bool:
         """Return True if the conversation currently awaits user input."""
@@ -514,10 +529,9 @@ class AgentOrchestrator:
 
     async def _request_user_input(self, conversation_id: str):
         """Set conversation to require user input and send the request"""
-        conversation = await self.conversation_manager.get_conversation(conversation_id)
-        if conversation:
-            conversation.require_user_input()
-            await self.conversation_manager.update_conversation(conversation)
+        await self.conversation_manager.set_conversation_status(
+            conversation_id, ConversationStatus.REQUIRE_USER_INPUT
+        )
 
     def _validate_execution_context(
         self, context: ExecutionContext, user_id: str
@@ -608,10 +622,9 @@ class AgentOrchestrator:
         self.user_input_manager.clear_request(conversation_id)
 
         # Reset conversation status
-        conversation = await self.conversation_manager.get_conversation(conversation_id)
-        if conversation:
-            conversation.activate()
-            await self.conversation_manager.update_conversation(conversation)
+        await self.conversation_manager.set_conversation_status(
+            conversation_id, ConversationStatus.ACTIVE
+        )
 
     async def _cleanup_expired_contexts(
         self, max_age_seconds: int = DEFAULT_CONTEXT_TIMEOUT_SECONDS
@@ -855,15 +868,6 @@ class AgentOrchestrator:
         await self._persist_items(items)
 
     async def _persist_items(self, items: list[SaveItem]):
-        """Persist a list of SaveItems to the conversation manager."""
-        for it in items:
-            await self.conversation_manager.add_item(
-                role=it.role,
-                event=it.event,
-                conversation_id=it.conversation_id,
-                thread_id=it.thread_id,
-                task_id=it.task_id,
-                payload=it.payload,
-                item_id=it.item_id,
-                agent_name=it.agent_name,
-            )
+        """Persist a list of SaveItems to the conversation manager in one batch."""
+        if items:
+            await self.conversation_manager.add_items(items)
@@ -4,10 +4,17 @@ This module provides utilities for constructing the planner's instruction
 prompt, including injecting the current date/time into prompts. The
 large `PLANNER_INSTRUCTIONS` constant contains the guidance used by the
 ExecutionPlanner when calling the LLM-based planning agent.
+
+Both prompts are immutable module-level constants built once at import and
+passed by reference to the planning agent; callers must not concatenate or
+re-format them per request.
 """
 
+import hashlib
+from typing import Final, Optional
+
 # noqa: E501
-PLANNER_INSTRUCTION = """
+PLANNER_INSTRUCTION: Final[str] = """
 <purpose>
 You are an AI Agent execution planner that forwards user requests to the specified target agent as simple, executable tasks.
 </purpose>
@@ -35,22 +42,7 @@ You are an AI Agent execution planner that forwards user requests to the specifi
 </core_rules>
 """
 
-PLANNER_EXPECTED_OUTPUT = """
-<task_creation_guidelines>
-
-<default_behavior>
-- Default to pass-through: create a single task addressed to the provided `target_agent_name`, or to the best-fit agent identified via `tool_get_enabled_agents` when the target is unspecified (fall back to "ResearchAgent" only if no clear match is found).
-- Set `pattern` to `once` unless the user explicitly confirms recurring intent.
-- Avoid query optimization and task splitting.
-</default_behavior>
-
-<when_to_pause>
-- If the request is clearly unusable (illegal content or impossible instruction), return `adequate: false` with a short reason and no tasks.
-- If the request suggests recurring monitoring, return `adequate: false` with a confirmation question; after explicit confirmation, create a single `recurring` task with the original query unchanged.
-</when_to_pause>
-
-</task_creation_guidelines>
-
+PLANNER_EXPECTED_OUTPUT: Final[str] = """
 <response_requirements>
 **Output valid JSON only (no markdown, backticks, or comments):**
 
@@ -71,105 +63,56 @@ PLANNER_EXPECTED_OUTPUT = """
 </response_requirements>
 
 <examples>
-
-<example_pass_through>
-Input:
-{
-  "target_agent_name": "ResearchAgent",
-  "query": "What was Tesla's Q3 2024 revenue?"
-}
-
-Output:
-{
-  "tasks": [
-    {
-      "query": "What was Tesla's Q3 2024 revenue?",
-      "agent_name": "ResearchAgent",
-      "pattern": "once"
-    }
-  ],
-  "adequate": true,
-  "reason": "Pass-through to the specified agent."
-}
-</example_pass_through>
-
-<example_default_agent>
-Input:
-{
-  "target_agent_name": null,
-  "query": "Analyze the latest market trends"
-}
-
-Output:
-{
-  "tasks": [
-    {
-      "query": "Analyze the latest market trends",
-      "agent_name": "ResearchAgent",
-      "pattern": "once"
-    }
-  ],
-  "adequate": true,
-  "reason": "No target agent specified; selected ResearchAgent after reviewing tool_get_enabled_agents."
-}
-</example_default_agent>
-
-<example_contextual>
-Input:
-{
-  "target_agent_name": "ResearchAgent",
-  "query": "Go on"
-}
-
-Output:
-{
-  "tasks": [
-    {
-      "query": "Go on",
-      "agent_name": "ResearchAgent",
-      "pattern": "once"
-    }
-  ],
-  "adequate": true,
-  "reason": "Contextual continuation; forwarded unchanged."
-}
-</example_contextual>
-
-<example_recurring_confirmation>
-// Step 1: needs confirmation
-Input:
-{
-  "target_agent_name": "ResearchAgent",
-  "query": "Monitor Apple's quarterly earnings and notify me each time they release results"
-}
-
-Output:
-{
-  "tasks": [],
-  "adequate": false,
-  "reason": "This suggests recurring monitoring. Do you want regular updates on this, or a one-time analysis?"
-}
-
-// Step 2: user confirms
-Input:
-{
-  "target_agent_name": "ResearchAgent",
-  "query": "Yes, set up regular updates"
-}
-
-Output:
-{
-  "tasks": [
-    {
-      "query": "Yes, set up regular updates",
-      "agent_name": "ResearchAgent",
-      "pattern": "recurring"
-    }
-  ],
-  "adequate": true,
-  "reason": "User confirmed recurring intent; created a single recurring task with the original query."
-}
-</example_recurring_confirmation>
-
+Each row is one planner call. In every row that creates a task, `query` is the input query copied verbatim.
+
+| target_agent_name | input query | tasks (agent_name, pattern) | adequate | reason |
+|---|---|---|---|---|
+| "ResearchAgent" | What was Tesla's Q3 2024 revenue? | ResearchAgent, once | true | Pass-through to the specified agent. |
+| null | Analyze the latest market trends | ResearchAgent, once | true | No target agent specified; selected ResearchAgent after reviewing tool_get_enabled_agents. |
+| "ResearchAgent" | Go on | ResearchAgent, once | true | Contextual continuation; forwarded unchanged. |
+| "ResearchAgent" | Monitor Apple's quarterly earnings and notify me each time they release results | [] | false | This suggests recurring monitoring. Do you want regular updates on this, or a one-time analysis? |
+| "ResearchAgent" | Yes, set up regular updates | ResearchAgent, recurring | true | User confirmed recurring intent; created a single recurring task with the original query. |
+
+- Contextual continuation (row 3): short replies like "Go on" are valid input; forward them unchanged as one `once` task.
+- Recurring confirmation (rows 4-5): first return `"tasks": []` with the confirmation question; only after the user confirms, create one `recurring` task.
 </examples>
 """
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """Return the hex SHA-256 digest of a prompt's UTF-8 text."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+# Fingerprint of the static planner prompt, usable as a prompt-cache key
+PLANNER_PROMPT_SHA256: Final[str] = prompt_fingerprint(
+    PLANNER_INSTRUCTION + PLANNER_EXPECTED_OUTPUT
+)
+
+_planner_prompt_tokens: Optional[int] = None
+
+
+def planner_prompt_token_count() -> Optional[int]:
+    """Return the token count of the static planner prompt, computed once.
+
+    Uses the optional `tiktoken` package; returns None when it is not
+    installed or its encoding cannot be loaded. Failures are not cached, so
+    a later call retries once the encoding becomes available.
+    """
+    global _planner_prompt_tokens
+    if _planner_prompt_tokens is not None:
+        return _planner_prompt_tokens
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        # Downloads the encoding on first use; network and cache-file errors
+        # surface as OSError, unknown or corrupt encodings as ValueError
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except (OSError, ValueError):
+        return None
+    _planner_prompt_tokens = len(encoding.encode(PLANNER_INSTRUCTION)) + len(
+        encoding.encode(PLANNER_EXPECTED_OUTPUT)
+    )
+    return _planner_prompt_tokens
@@ -8,7 +8,9 @@ from valuecell.core.types import (
     BaseResponse,
     BaseResponseDataPayload,
     CommonResponseEvent,
+    ConversationItemEvent,
     NotifyResponseEvent,
+    ResponsePayload,
     Role,
     StreamResponseEvent,
     SystemResponseEvent,
@@ -17,20 +19,20 @@ from valuecell.core.types import (
 from valuecell.utils.uuid import generate_item_id
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveItem:
     item_id: str
-    event: object  # ConversationItemEvent union; keep generic to avoid circular typing
+    event: ConversationItemEvent
     conversation_id: str
     thread_id: Optional[str]
     task_id: Optional[str]
-    payload: Optional[BaseModel]
+    payload: Optional[ResponsePayload]
     role: Role = Role.AGENT
     agent_name: Optional[str] = None
 
 
 # conversation_id, thread_id, task_id, event
-BufferKey = Tuple[str, Optional[str], Optional[str], object]
+BufferKey = Tuple[str, Optional[str], Optional[str], ConversationItemEvent]
 
 
 class BufferEntry:
@@ -292,9 +294,9 @@ class ResponseBuffer:
 
     def _make_save_item(
         self,
-        event: object,
+        event: ConversationItemEvent,
         data: UnifiedResponseData,
-        payload: BaseModel,
+        payload: ResponsePayload,
         item_id: str | None = None,
     ) -> SaveItem:
         return SaveItem(
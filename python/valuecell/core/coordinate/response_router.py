@@ -28,7 +28,7 @@ class SideEffectKind(Enum):
     FAIL_TASK = "fail_task"
 
 
-@dataclass
+@dataclass(slots=True)
 class SideEffect:
     """Represents a side-effect produced by event routing.
 
@@ -41,7 +41,7 @@ class SideEffect:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteResult:
     """Result of routing a single incoming event.
 
@@ -9,7 +9,7 @@ Focus on essential behavior without over-engineering:
 
 from types import SimpleNamespace
 from typing import Any, AsyncGenerator
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from a2a.types import (
@@ -33,7 +33,7 @@ from valuecell.core.coordinate.super_agent import (
 )
 from valuecell.core.conversation import ConversationStatus
 from valuecell.core.task import Task, TaskStatus as CoreTaskStatus
-from valuecell.core.types import UserInput, UserInputMetadata
+from valuecell.core.types import SystemResponseEvent, UserInput, UserInputMetadata
 
 
 # -------------------------
@@ -95,29 +95,24 @@ def _sample_plan(
 
 
 def _stub_conversation(status: Any = ConversationStatus.ACTIVE):
-    # Minimal conversation stub with status and basic methods used by orchestrator
-    s = SimpleNamespace(status=status)
-
-    def activate():
-        s.status = ConversationStatus.ACTIVE
-
-    def require_user_input():
-        s.status = ConversationStatus.REQUIRE_USER_INPUT
-
-    s.activate = activate
-    s.require_user_input = require_user_input
-    return s
+    # Minimal conversation stub; status changes go through the manager
+    return SimpleNamespace(status=status)
 
 
 @pytest.fixture(name="mock_conversation_manager")
 def _mock_conversation_manager() -> Mock:
     m = Mock()
     m.add_item = AsyncMock()
+    m.add_items = AsyncMock(return_value=[])
     m.create_conversation = AsyncMock(return_value="new-conversation-id")
     m.get_conversation_items = AsyncMock(return_value=[])
     m.list_user_conversations = AsyncMock(return_value=[])
     m.get_conversation = AsyncMock(return_value=_stub_conversation())
+    m.get_or_create_conversation = AsyncMock(
+        side_effect=lambda *args, **kwargs: (_stub_conversation(), False)
+    )
     m.update_conversation = AsyncMock()
+    m.set_conversation_status = AsyncMock(return_value=True)
     return m
 
 
@@ -300,6 +295,28 @@ async def test_happy_path_non_streaming(
     assert len(out) >= 1
 
 
+@pytest.mark.asyncio
+async def test_new_conversation_emits_conversation_started(
+    orchestrator: AgentOrchestrator, sample_user_input: UserInput
+):
+    orchestrator.conversation_manager.get_or_create_conversation.side_effect = None
+    orchestrator.conversation_manager.get_or_create_conversation.return_value = (
+        _stub_conversation(),
+        True,
+    )
+
+    out = []
+    async for chunk in orchestrator.process_user_input(sample_user_input):
+        out.append(chunk)
+
+    orchestrator.conversation_manager.get_or_create_conversation.assert_awaited_once_with(
+        sample_user_input.meta.user_id,
+        sample_user_input.meta.conversation_id,
+        agent_name=sample_user_input.target_agent_name,
+    )
+    assert out[0].event == SystemResponseEvent.CONVERSATION_STARTED
+
+
 @pytest.mark.asyncio
 async def test_planner_error(
     orchestrator: AgentOrchestrator, sample_user_input: UserInput
@@ -414,11 +431,6 @@ async def test_cancel_execution_with_planning_task(
     # Mock user input manager
     orchestrator.user_input_manager.clear_request = Mock()
 
-    # Mock conversation manager
-    mock_conversation = _stub_conversation()
-    orchestrator.conversation_manager.get_conversation.return_value = mock_conversation
-    orchestrator.conversation_manager.update_conversation = AsyncMock()
-
     # Call _cancel_execution to trigger
     await orchestrator._cancel_execution(conversation_id)
 
@@ -430,6 +442,9 @@ async def test_cancel_execution_with_planning_task(
     orchestrator.user_input_manager.clear_request.assert_called_once_with(
         conversation_id
     )
+    orchestrator.conversation_manager.set_conversation_status.assert_awaited_once_with(
+        conversation_id, ConversationStatus.ACTIVE
+    )
 
 
 @pytest.mark.asyncio
@@ -535,3 +550,38 @@ async def test_super_agent_handoff_creates_component_events(
     ]
     assert any('"phase": "start"' in payload for payload in component_payloads)
     assert any('"phase": "end"' in payload for payload in component_payloads)
+
+
+def test_orchestrators_share_default_conversation_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("VALUECELL_SQLITE_DB", str(tmp_path / "shared.db"))
+
+    first = AgentOrchestrator()
+    second = AgentOrchestrator()
+
+    assert first.conversation_manager is second.conversation_manager
+
+    monkeypatch.setenv("VALUECELL_SQLITE_DB", str(tmp_path / "other.db"))
+    third = AgentOrchestrator()
+
+    assert third.conversation_manager is not first.conversation_manager
+
+
+def test_orchestrator_accepts_injected_conversation_manager(
+    mock_conversation_manager: Mock,
+):
+    o = AgentOrchestrator(conversation_manager=mock_conversation_manager)
+
+    assert o.conversation_manager is mock_conversation_manager
+
+
+def test_orchestrator_builds_planner_and_super_agent_lazily(
+    mock_conversation_manager: Mock,
+):
+    with patch("valuecell.core.coordinate.orchestrator.SuperAgent") as super_agent_cls:
+        o = AgentOrchestrator(conversation_manager=mock_conversation_manager)
+        super_agent_cls.assert_not_called()
+        assert "planner" not in vars(o)
+
+        assert o.super_agent is o.super_agent
+        super_agent_cls.assert_called_once_with()
+        assert o.planner.agent_connections is o.agent_connections
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from types import SimpleNamespace
 
 import pytest
@@ -151,3 +152,60 @@ def test_tool_get_enabled_agents_formats_cards():
     assert "<AgentAlpha>" in output
     assert "Lookup" in output
     assert "</AgentAlpha>" in output
+
+
+def test_planner_prompt_fingerprint_tracks_prompt_text():
+    from valuecell.core.coordinate import planner_prompts
+
+    # Known SHA-256 test vector
+    assert planner_prompts.prompt_fingerprint("abc") == (
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    )
+
+    prompt = (
+        planner_prompts.PLANNER_INSTRUCTION + planner_prompts.PLANNER_EXPECTED_OUTPUT
+    )
+    assert planner_prompts.PLANNER_PROMPT_SHA256 == planner_prompts.prompt_fingerprint(
+        prompt
+    )
+    assert planner_prompts.PLANNER_PROMPT_SHA256 != planner_prompts.prompt_fingerprint(
+        prompt + " "
+    )
+
+
+def test_planner_prompt_token_count_without_tiktoken(monkeypatch: pytest.MonkeyPatch):
+    from valuecell.core.coordinate import planner_prompts
+
+    monkeypatch.setattr(planner_prompts, "_planner_prompt_tokens", None)
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+    assert planner_prompts.planner_prompt_token_count() is None
+
+
+def test_planner_prompt_token_count_retries_after_encoding_failure(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from valuecell.core.coordinate import planner_prompts
+
+    calls = []
+
+    def get_encoding(name):
+        calls.append(name)
+        if len(calls) == 1:
+            raise ConnectionError("encoding download failed")
+        return SimpleNamespace(encode=lambda text: text.split())
+
+    monkeypatch.setattr(planner_prompts, "_planner_prompt_tokens", None)
+    monkeypatch.setitem(
+        sys.modules, "tiktoken", SimpleNamespace(get_encoding=get_encoding)
+    )
+
+    assert planner_prompts.planner_prompt_token_count() is None
+
+    expected = len(planner_prompts.PLANNER_INSTRUCTION.split()) + len(
+        planner_prompts.PLANNER_EXPECTED_OUTPUT.split()
+    )
+    assert planner_prompts.planner_prompt_token_count() == expected
+    # Successful counts are cached
+    assert planner_prompts.planner_prompt_token_count() == expected
+    assert calls == ["cl100k_base", "cl100k_base"]
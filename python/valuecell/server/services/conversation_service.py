@@ -2,11 +2,6 @@
 
 from typing import Optional
 
-from valuecell.core.conversation import (
-    ConversationManager,
-    SQLiteConversationStore,
-    SQLiteItemStore,
-)
 from valuecell.core.coordinate.orchestrator import AgentOrchestrator
 from valuecell.server.api.schemas.conversation import (
     ConversationDeleteData,
@@ -16,7 +11,6 @@ from valuecell.server.api.schemas.conversation import (
     ConversationListItem,
     MessageData,
 )
-from valuecell.utils import resolve_db_path
 
 
 class ConversationService:
@@ -24,14 +18,10 @@ class ConversationService:
 
     def __init__(self):
         """Initialize the conversation service."""
-        # Use the existing database path resolver
-        db_path = resolve_db_path()
-        self.item_store = SQLiteItemStore(db_path=db_path)
-        conversation_store = SQLiteConversationStore(db_path=db_path)
-        self.conversation_manager = ConversationManager(
-            conversation_store=conversation_store, item_store=self.item_store
-        )
         self.orchestrator = AgentOrchestrator()
+        # Share the orchestrator's manager so reads and writes hit one cache
+        self.conversation_manager = self.orchestrator.conversation_manager
+        self.item_store = self.conversation_manager.item_store
 
     async def get_conversation_list(
         self, user_id: Optional[str] = None, limit: int = 10, offset: int = 0
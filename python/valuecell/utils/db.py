@@ -1,7 +1,25 @@
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Final, Iterator, Sequence, TypeVar
+
+import aiosqlite
 
 from .path import get_repo_root_path
 
+T = TypeVar("T")
+
+# Upper bound on bound parameters per statement. SQLite builds before 3.32
+# default SQLITE_MAX_VARIABLE_NUMBER to 999, so stay well below it.
+SQLITE_MAX_VARIABLES = 500
+
+# Persistent database-level setting, applied once when a store's schema is created
+SQLITE_INIT_PRAGMAS: Final[str] = "PRAGMA journal_mode=WAL;"
+
+# Connection-level settings; with WAL, synchronous=NORMAL skips the fsync per commit
+SQLITE_CONNECTION_PRAGMAS: Final[str] = (
+    "PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+)
+
 
 def resolve_db_path() -> str:
     return os.environ.get("VALUECELL_SQLITE_DB") or os.path.join(
@@ -13,3 +31,19 @@ def resolve_lancedb_uri() -> str:
     return os.environ.get("VALUECELL_LANCEDB_URI") or os.path.join(
         get_repo_root_path(), "lancedb"
     )
+
+
+def chunked(
+    items: Sequence[T], size: int = SQLITE_MAX_VARIABLES
+) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of `items` holding at most `size` elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@asynccontextmanager
+async def connect_sqlite(db_path: str) -> AsyncIterator[aiosqlite.Connection]:
+    """Open an aiosqlite connection with the shared per-connection pragmas."""
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(SQLITE_CONNECTION_PRAGMAS)
+        yield db